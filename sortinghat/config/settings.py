@@ -17,6 +17,28 @@ import os
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+
+#
+# Helpers to read the configuration from the environment
+#
+
+def _env_bool(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ('true', '1')
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return default if value is None else int(value)
+
+
+def _env_list(name, default=None):
+    value = os.environ.get(name)
+    return default if value is None else value.split(',')
+
+
 SILENCED_SYSTEM_CHECKS = [
     'django_mysql.E016'
 ]
@@ -31,7 +53,7 @@ SILENCED_SYSTEM_CHECKS = [
 # https://docs.djangoproject.com/en/3.1/ref/settings/#std:setting-DEBUG
 #
 
-DEBUG = os.environ.get('SORTINGHAT_DEBUG', 'False').lower() in ('true', '1')
+DEBUG = _env_bool('SORTINGHAT_DEBUG')
 
 #
 # ALLOWED_HOST protects the site against CSRF attacks.
@@ -41,13 +63,10 @@ DEBUG = os.environ.get('SORTINGHAT_DEBUG', 'False').lower() in ('true', '1')
 # https://docs.djangoproject.com/en/3.1/ref/settings/#allowed-hosts
 #
 
-if 'SORTINGHAT_ALLOWED_HOST' in os.environ:
-    ALLOWED_HOSTS = os.environ['SORTINGHAT_ALLOWED_HOST'].split(',')
-else:
-    ALLOWED_HOSTS = [
-        '127.0.0.1',
-        'localhost',
-    ]
+ALLOWED_HOSTS = _env_list('SORTINGHAT_ALLOWED_HOST', [
+    '127.0.0.1',
+    'localhost',
+])
 
 #
 # The secret key must be a large random value and it must be kept secret.
@@ -257,13 +276,26 @@ LOGGING = {
 # SortingHat.
 #
 
+# Connection parameters are shared by the default database
+# and the tenants' databases, so they are read only once.
+#
+# Connections are kept open between requests for
+# SORTINGHAT_DB_CONN_MAX_AGE seconds (0 closes them at the end
+# of each request) and checked before they are reused.
+
+_DB_CONNECTION = {
+    'ENGINE': 'django.db.backends.mysql',
+    'HOST': os.environ.get('SORTINGHAT_DB_HOST', '127.0.0.1'),
+    'PORT': _env_int('SORTINGHAT_DB_PORT', 3306),
+    'USER': os.environ.get('SORTINGHAT_DB_USER', 'root'),
+    'PASSWORD': os.environ.get('SORTINGHAT_DB_PASSWORD', ''),
+    'CONN_MAX_AGE': _env_int('SORTINGHAT_DB_CONN_MAX_AGE', 600),
+    'CONN_HEALTH_CHECKS': True,
+}
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'HOST': os.environ.get('SORTINGHAT_DB_HOST', '127.0.0.1'),
-        'PORT': os.environ.get('SORTINGHAT_DB_PORT', 3306),
-        'USER': os.environ.get('SORTINGHAT_DB_USER', 'root'),
-        'PASSWORD': os.environ.get('SORTINGHAT_DB_PASSWORD', ''),
+        **_DB_CONNECTION,
         'NAME': os.environ.get('SORTINGHAT_DB_DATABASE', 'sortinghat_test'),
         'OPTIONS': {'charset': 'utf8mb4'},
     }
@@ -282,14 +314,16 @@ DATABASES = {
 # https://github.com/rq/django-rq
 #
 
+_RQ_CONNECTION = {
+    'HOST': os.environ.get('SORTINGHAT_REDIS_HOST', '127.0.0.1'),
+    'PORT': _env_int('SORTINGHAT_REDIS_PORT', 6379),
+    'PASSWORD': os.environ.get('SORTINGHAT_REDIS_PASSWORD', ''),
+    'ASYNC': _env_bool('SORTINGHAT_WORKERS_ASYNC', True),
+    'DB': _env_int('SORTINGHAT_REDIS_DB', 0),
+}
+
 RQ_QUEUES = {
-    'default': {
-        'HOST': os.environ.get('SORTINGHAT_REDIS_HOST', '127.0.0.1'),
-        'PORT': os.environ.get('SORTINGHAT_REDIS_PORT', 6379),
-        'PASSWORD': os.environ.get('SORTINGHAT_REDIS_PASSWORD', ''),
-        'ASYNC': os.environ.get('SORTINGHAT_WORKERS_ASYNC', True),
-        'DB': os.environ.get('SORTINGHAT_REDIS_DB', 0),
-    }
+    'default': dict(_RQ_CONNECTION)
 }
 
 RQ = {
@@ -311,7 +345,7 @@ RQ = {
 #   - Assign users to tenants with 'set_user_tenant' command.
 #
 
-MULTI_TENANT = os.environ.get('SORTINGHAT_MULTI_TENANT', 'False').lower() in ('true', '1')
+MULTI_TENANT = _env_bool('SORTINGHAT_MULTI_TENANT')
 
 if MULTI_TENANT:
     MIDDLEWARE += ['sortinghat.core.middleware.TenantDatabaseMiddleware']
@@ -327,11 +361,7 @@ if MULTI_TENANT:
 
     DATABASES.update({
         tenant: {
-            'ENGINE': 'django.db.backends.mysql',
-            'HOST': os.environ.get('SORTINGHAT_DB_HOST', '127.0.0.1'),
-            'PORT': os.environ.get('SORTINGHAT_DB_PORT', 3306),
-            'USER': os.environ.get('SORTINGHAT_DB_USER', 'root'),
-            'PASSWORD': os.environ.get('SORTINGHAT_DB_PASSWORD', ''),
+            **_DB_CONNECTION,
             'NAME': tenant,
             'OPTIONS': {'charset': 'utf8mb4'},
         }
@@ -339,13 +369,7 @@ if MULTI_TENANT:
     })
 
     RQ_QUEUES.update({
-        tenant: {
-            'HOST': os.environ.get('SORTINGHAT_REDIS_HOST', '127.0.0.1'),
-            'PORT': os.environ.get('SORTINGHAT_REDIS_PORT', 6379),
-            'PASSWORD': os.environ.get('SORTINGHAT_REDIS_PASSWORD', ''),
-            'ASYNC': os.environ.get('SORTINGHAT_WORKERS_ASYNC', True),
-            'DB': os.environ.get('SORTINGHAT_REDIS_DB', 0),
-        }
+        tenant: dict(_RQ_CONNECTION)
         for tenant in TENANTS_DEDICATED_QUEUES
     })
 
@@ -365,6 +389,12 @@ SORTINGHAT_AUTHENTICATION_REQUIRED = True
 
 SORTINGHAT_API_PAGE_SIZE = 10
 
+#
+# Parse large identities files (i.e. gitdm) using a pool of processes
+#
+
+SORTINGHAT_PARALLEL_PARSE = _env_bool('SORTINGHAT_PARALLEL_PARSE')
+
 #
 # genderize.io token, used only for gender recommendations
 #
@@ -384,5 +414,5 @@ PERMISSION_GROUPS_LIST_PATH = os.environ.get('SORTINGHAT_PERMISSION_GROUPS_LIST_
 # Trusted data sources for matching by username
 #
 
-MATCH_TRUSTED_SOURCES = os.environ.get('SORTINGHAT_MATCH_TRUSTED_SOURCES',
-                                       'github,gitlab,slack').split(',')
+MATCH_TRUSTED_SOURCES = _env_list('SORTINGHAT_MATCH_TRUSTED_SOURCES',
+                                  ['github', 'gitlab', 'slack'])
@@ -24,7 +24,8 @@ import logging
 
 from grimoirelab_toolkit.datetime import datetime_to_utc, datetime_utcnow
 
-from .db import (find_individual_by_uuid,
+from .db import (find_individual,
+                 find_individual_by_uuid,
                  find_identity,
                  find_organization,
                  find_domain,
@@ -33,6 +34,7 @@ from .db import (find_individual_by_uuid,
                  find_scheduled_task,
                  find_alias,
                  search_enrollments_in_period,
+                 search_enrollment_periods,
                  add_individual as add_individual_db,
                  add_identity as add_identity_db,
                  add_organization as add_organization_db,
@@ -54,7 +56,9 @@ from .db import (find_individual_by_uuid,
                  lock as lock_db,
                  unlock as unlock_db,
                  add_enrollment,
+                 add_enrollments,
                  delete_enrollment,
+                 delete_enrollments,
                  move_domain,
                  move_team,
                  move_alias,
@@ -65,7 +69,10 @@ from .errors import (InvalidValueError,
                      DuplicateRangeError,
                      EqualIndividualError)
 from .log import TransactionsLog
-from .models import Identity, MergeRecommendation, MIN_PERIOD_DATE, MAX_PERIOD_DATE
+from .models import (Identity,
+                     MergeRecommendation,
+                     MIN_PERIOD_DATE,
+                     MAX_PERIOD_DATE)
 from .aux import merge_datetime_ranges
 from .decorators import atomic_using_tenant
 from ..utils import generate_uuid
@@ -201,15 +208,17 @@ def delete_identity(ctx, uuid):
 
     trxl = TransactionsLog.open('delete_identity', ctx)
 
+    # The individual is fetched together with the identity and
+    # it is up to date after removing the identity, so there is
+    # no need to query it again
     identity = find_identity(uuid)
     individual = identity.individual
 
     if individual.mk == uuid:
-        delete_individual_db(trxl, identity.individual)
+        delete_individual_db(trxl, individual)
         individual = None
     else:
         delete_identity_db(trxl, identity)
-        individual.refresh_from_db()
 
     trxl.close()
 
@@ -809,7 +818,6 @@ def delete_team(ctx, team_name, organization=None):
     return team
 
 
-@atomic_using_tenant
 def enroll(ctx, uuid, group, parent_org=None, from_date=None, to_date=None,
            force=False):
     """Enroll an individual in a group.
@@ -867,27 +875,44 @@ def enroll(ctx, uuid, group, parent_org=None, from_date=None, to_date=None,
     if group == '':
         raise InvalidValueError(msg="'group' cannot be an empty string")
 
-    trxl = TransactionsLog.open('enroll', ctx)
-
     from_date = datetime_to_utc(from_date) if from_date else MIN_PERIOD_DATE
     to_date = datetime_to_utc(to_date) if to_date else MAX_PERIOD_DATE
 
+    assert from_date.tzinfo is to_date.tzinfo is MIN_PERIOD_DATE.tzinfo, \
+        "period dates must share the UTC tzinfo of the default dates"
+
     if from_date > to_date:
         msg = "'start' date {} cannot be greater than {}".format(from_date, to_date)
         raise InvalidValueError(msg=msg)
 
-    # Find and check entities
-    individual = find_individual_by_uuid(uuid)
+    # Find and check the group
     group = find_group(group, parent_org)
 
+    return _enroll(ctx, uuid, group, parent_org,
+                   from_date, to_date, force)
+
+
+@atomic_using_tenant
+def _enroll(ctx, uuid, group, parent_org, from_date, to_date, force):
+    """Enroll an individual in a group within a transaction.
+
+    Inputs must be checked and the group found before calling
+    this function, so invalid calls to `enroll` fail without
+    opening a transaction. The individual is found within the
+    transaction, so it is saved with its latest data.
+    """
+    trxl = TransactionsLog.open('enroll', ctx)
+
+    individual = find_individual_by_uuid(uuid)
+
     # Get the list of current ranges
     # Check whether the new one already exist
-    enrollments_db = search_enrollments_in_period(individual.mk, group.name,
-                                                  parent_org=parent_org,
-                                                  from_date=from_date,
-                                                  to_date=to_date)
+    enrollments_db = search_enrollment_periods(individual.mk, group.name,
+                                               parent_org=parent_org,
+                                               from_date=from_date,
+                                               to_date=to_date)
 
-    periods = [[enr_db.start, enr_db.end] for enr_db in enrollments_db]
+    periods = [[start, end] for _, start, end in enrollments_db]
 
     for period in periods:
         if from_date >= period[0] and to_date <= period[1]:
@@ -903,17 +928,15 @@ def enroll(ctx, uuid, group, parent_org=None, from_date=None, to_date=None,
     periods.append([from_date, to_date])
 
     # Remove old enrollments and add new ones based in the new ranges
-    for enrollment_db in enrollments_db:
-        delete_enrollment(trxl, enrollment_db)
+    delete_enrollments(trxl, individual, group, enrollments_db)
 
     try:
         dt_ranges = merge_datetime_ranges(periods, exclude_limits=force)
-        for start_dt, end_dt in dt_ranges:
-            add_enrollment(trxl, individual, group, start=start_dt, end=end_dt)
+        add_enrollments(trxl, individual, group, list(dt_ranges))
     except ValueError as e:
         raise InvalidValueError(msg=str(e))
 
-    individual.refresh_from_db()
+    individual = find_individual(individual.mk, prefetch_enrollments=True)
 
     trxl.close()
 
@@ -19,11 +19,21 @@
 #     Santiago Dueñas <sduenas@bitergia.com>
 #
 
+import datetime
 import re
 
 from .models import MIN_PERIOD_DATE, MAX_PERIOD_DATE
 
 
+# Minimum number of ranges to merge them using numpy arrays;
+# for smaller sets, the overhead of building the arrays
+# is higher than the time saved
+MERGE_RANGES_NUMPY_THRESHOLD = 32
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
 def merge_datetime_ranges(dates, exclude_limits=False):
     """Merge datetime ranges.
 
@@ -54,6 +64,9 @@ def merge_datetime_ranges(dates, exclude_limits=False):
     true for each date. Otherwise, the generator will raise a
     `ValueError` exception.
 
+    Large sets of ranges are merged using `merge_datetime_ranges_np`
+    when `exclude_limits` is not set.
+
     :param dates: sequence of datetime ranges where each range is a
         (start_date, end_date) tuple
     :param exclude_limits: remove MIN_PERIOD_DATE and MAX_PERIOD_DATE
@@ -64,13 +77,84 @@ def merge_datetime_ranges(dates, exclude_limits=False):
     :raises ValueError: when a value of the data range is out of bounds
     :raises TypeError: when timezone info is not set in any datetime object
     """
-    # This code is based on samplebias' answer to StackOverflow question
-    # "Merging a list of time-range tuples that have overlapping time-ranges"
-    # (http: // stackoverflow.com / questions / 5679638).
+    if not dates:
+        return
+
+    if not exclude_limits and len(dates) > MERGE_RANGES_NUMPY_THRESHOLD:
+        yield from merge_datetime_ranges_np(dates)
+    else:
+        yield from _merge_datetime_ranges(dates, exclude_limits)
+
+
+def merge_datetime_ranges_np(dates):
+    """Merge datetime ranges using numpy arrays.
+
+    Generator that produces the same ranges `merge_datetime_ranges`
+    does when `exclude_limits` is not set. Dates are converted to
+    microseconds since the epoch and the ranges are merged with
+    a vectorized sweep over the sorted arrays, which is faster
+    for large sets of ranges.
+
+    :param dates: sequence of datetime ranges where each range is a
+        (start_date, end_date) tuple
+    :returns: a generator of merged datetime ranges where each range
+        is a (start_date, end_date) tuple
 
+    :raises ValueError: when a value of the data range is out of bounds
+    :raises TypeError: when timezone info is not set in any datetime object
+    """
     if not dates:
         return
 
+    # numpy is only needed for large sets of ranges,
+    # so it is not imported when the module is loaded
+    import numpy
+
+    try:
+        ranges = [(start, end) if start <= end else (end, start)
+                  for start, end in dates]
+        starts = numpy.fromiter(((start - _EPOCH) // _ONE_MICROSECOND for start, _ in ranges),
+                                dtype=numpy.int64, count=len(ranges))
+        ends = numpy.fromiter(((end - _EPOCH) // _ONE_MICROSECOND for _, end in ranges),
+                              dtype=numpy.int64, count=len(ranges))
+    except TypeError:
+        # Let the default implementation raise the error
+        yield from _merge_datetime_ranges(dates, False)
+        return
+
+    min_ts = (MIN_PERIOD_DATE - _EPOCH) // _ONE_MICROSECOND
+    max_ts = (MAX_PERIOD_DATE - _EPOCH) // _ONE_MICROSECOND
+
+    if starts.min() < min_ts or ends.max() > max_ts:
+        yield from _merge_datetime_ranges(dates, False)
+        return
+
+    order = numpy.lexsort((ends, starts))
+    starts = starts[order]
+    ends = ends[order]
+
+    # A new range starts when its start date is greater than
+    # the end dates of all the ranges sorted before it
+    cum_ends = numpy.maximum.accumulate(ends)
+    new_range = numpy.empty(len(starts), dtype=bool)
+    new_range[0] = True
+    new_range[1:] = starts[1:] > cum_ends[:-1]
+
+    firsts = numpy.flatnonzero(new_range)
+    lasts = numpy.append(firsts[1:], len(starts)) - 1
+
+    for first, last in zip(firsts.tolist(), lasts.tolist()):
+        # Return the original objects; the end date is the
+        # first one found with the greatest value
+        end_pos = first + int(numpy.argmax(ends[first:last + 1] == cum_ends[last]))
+        yield ranges[order[first]][0], ranges[order[end_pos]][1]
+
+
+def _merge_datetime_ranges(dates, exclude_limits):
+    # This code is based on samplebias' answer to StackOverflow question
+    # "Merging a list of time-range tuples that have overlapping time-ranges"
+    # (http: // stackoverflow.com / questions / 5679638).
+
     sorted_dates = sorted([sorted(t) for t in dates])
     date_range = list(sorted_dates[0])
 
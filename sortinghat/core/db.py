@@ -54,6 +54,10 @@ from .aux import validate_field
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of rows inserted on each bulk query
+BULK_BATCH_SIZE = 1000
+
+
 def _set_lock(individual, lock_flag):
     """Set a lock value for a given individual.
 
@@ -71,23 +75,34 @@ def _set_lock(individual, lock_flag):
     return individual
 
 
-def find_individual(mk):
+def find_individual(mk, prefetch_enrollments=False):
     """Find an individual entity.
 
     Find an individual by its main key (`mk`) in the database.
     When the individual does not exist the function will
     raise a `NotFoundError`.
 
+    When `prefetch_enrollments` is set, the profile and the
+    enrollments of the individual, with their groups, are
+    fetched in advance.
+
     :param mk: main key or id of the individual to find
+    :param prefetch_enrollments: fetch the profile and the
+        enrollments of the individual too
 
     :returns: an individual object
 
     :raises NotFoundError: when the individual with
         the given `mk` does not exists.
     """
+    individuals = Individual.objects.all()
+
+    if prefetch_enrollments:
+        individuals = individuals.select_related('profile').prefetch_related('enrollments__group')
+
     try:
         logger.debug(f"Finding individual {mk} by main key ...")
-        individual = Individual.objects.get(mk=mk)
+        individual = individuals.get(mk=mk)
     except Individual.DoesNotExist:
         logger.debug(f"Individual with main key {mk} does not exist")
         raise NotFoundError(entity=mk)
@@ -139,7 +154,7 @@ def find_identity(uuid):
     """
     try:
         logger.debug(f"Finding identity UUID {uuid} ...")
-        identity = Identity.objects.get(uuid=uuid)
+        identity = Identity.objects.select_related('individual').get(uuid=uuid)
     except Identity.DoesNotExist:
         logger.debug(f"Identity with UUID {uuid} does not exist")
         raise NotFoundError(entity=uuid)
@@ -315,10 +330,45 @@ def search_enrollments_in_period(mk, group_name,
         f"individual='{mk}' group='{group_name}'"
         f"from='{from_date}' to='{to_date}'"
     )
-    return Enrollment.objects.filter(individual__mk=mk,
-                                     group__name=group_name,
-                                     group__parent_org__name=parent_org,
-                                     start__lte=to_date, end__gte=from_date).order_by('start')
+    enrollments = Enrollment.objects.select_related('individual', 'group')
+    return _filter_enrollments_in_period(enrollments, mk, group_name,
+                                         parent_org, from_date, to_date)
+
+
+def search_enrollment_periods(mk, group_name,
+                              parent_org=None,
+                              from_date=MIN_PERIOD_DATE,
+                              to_date=MIN_PERIOD_DATE):
+    """Look for the periods of the enrollments in a given period.
+
+    Lightweight version of `search_enrollments_in_period`. Instead of
+    enrollment objects, it returns a list of `(id, start, end)` tuples,
+    so only these columns are fetched from the database.
+
+    :param mk: main key of the individual
+    :param group_name: name of the group
+    :param parent_org: name of the group's parent organization
+    :param from_date: starting date for the period
+    :param to_date: ending date for the period
+
+    :returns: a list of `(id, start, end)` tuples
+    """
+    logger.debug(
+        f"Run enrollment periods search; "
+        f"individual='{mk}' group='{group_name}'"
+        f"from='{from_date}' to='{to_date}'"
+    )
+    enrollments = _filter_enrollments_in_period(Enrollment.objects, mk, group_name,
+                                                parent_org, from_date, to_date)
+    return list(enrollments.values_list('pk', 'start', 'end'))
+
+
+def _filter_enrollments_in_period(enrollments, mk, group_name,
+                                  parent_org, from_date, to_date):
+    return enrollments.filter(individual__mk=mk,
+                              group__name=group_name,
+                              group__parent_org__name=parent_org,
+                              start__lte=to_date, end__gte=from_date).order_by('start')
 
 
 def add_organization(trxl, name):
@@ -833,20 +883,7 @@ def add_enrollment(trxl, individual, group,
     if individual.is_locked:
         raise LockedIdentityError(uuid=individual.mk)
 
-    if not start:
-        raise ValueError("'start' date cannot be None")
-    if not end:
-        raise ValueError("'end' date cannot be None")
-
-    start = datetime_to_utc(start)
-    end = datetime_to_utc(end)
-
-    if start < MIN_PERIOD_DATE or start > MAX_PERIOD_DATE:
-        raise ValueError("'start' date {} is out of bounds".format(start))
-    if end < MIN_PERIOD_DATE or end > MAX_PERIOD_DATE:
-        raise ValueError("'end' date {} is out of bounds".format(end))
-    if start > end:
-        raise ValueError("'start' date {} cannot be greater than {}".format(start, end))
+    start, end = _validate_enrollment_period(start, end)
 
     try:
         enrollment = Enrollment(individual=individual,
@@ -864,6 +901,88 @@ def add_enrollment(trxl, individual, group,
     return enrollment
 
 
+def add_enrollments(trxl, individual, group, periods):
+    """Enroll an individual to an organization in several periods.
+
+    Bulk version of `add_enrollment`. A new enrollment is created
+    for each `(start, end)` pair in `periods` and all of them are
+    inserted using bulk queries. Periods are checked as in
+    `add_enrollment` before anything is written.
+
+    :param trxl: TransactionsLog object from the method calling this one
+    :param individual: individual to enroll
+    :param group: group where the individual is enrolled
+    :param periods: list of `(start, end)` dates
+
+    :returns: a list of new enrollments
+
+    :raises ValueError: when any `start` or `end` are `None`;
+        when `start < MIN_PERIOD_DATE`; or `end > MAX_PERIOD_DATE`
+        or `start > end`.
+    """
+    if individual.is_locked:
+        raise LockedIdentityError(uuid=individual.mk)
+
+    enrollments = []
+    operations = []
+
+    for start, end in periods:
+        # Setting operation arguments before they are modified
+        op_args = {
+            'individual': individual.mk,
+            'group': group.name,
+            'start': str(start),
+            'end': str(end)
+        }
+
+        start, end = _validate_enrollment_period(start, end)
+
+        enrollments.append(Enrollment(individual=individual,
+                                      group=group,
+                                      start=start, end=end))
+        operations.append({
+            'op_type': Operation.OpType.ADD,
+            'entity_type': 'enrollment',
+            'timestamp': datetime_utcnow(),
+            'args': op_args,
+            'target': op_args['individual']
+        })
+
+    if not enrollments:
+        return enrollments
+
+    try:
+        Enrollment.objects.bulk_create(enrollments, batch_size=BULK_BATCH_SIZE)
+        individual.save()
+    except django.db.utils.IntegrityError as exc:
+        _handle_integrity_error(Enrollment, exc)
+
+    trxl.log_operations(operations, batch_size=BULK_BATCH_SIZE)
+
+    return enrollments
+
+
+def _validate_enrollment_period(start, end):
+    """Check the dates of an enrollment and convert them to UTC"""
+
+    if not start:
+        raise ValueError("'start' date cannot be None")
+    if not end:
+        raise ValueError("'end' date cannot be None")
+
+    start = datetime_to_utc(start)
+    end = datetime_to_utc(end)
+
+    if start < MIN_PERIOD_DATE or start > MAX_PERIOD_DATE:
+        raise ValueError("'start' date {} is out of bounds".format(start))
+    if end < MIN_PERIOD_DATE or end > MAX_PERIOD_DATE:
+        raise ValueError("'end' date {} is out of bounds".format(end))
+    if start > end:
+        raise ValueError("'start' date {} cannot be greater than {}".format(start, end))
+
+    return start, end
+
+
 def delete_enrollment(trxl, enrollment):
     """Remove an enrollment from the database.
 
@@ -892,6 +1011,51 @@ def delete_enrollment(trxl, enrollment):
                        target=op_args['mk'])
 
 
+def delete_enrollments(trxl, individual, group, periods):
+    """Remove a set of enrollments of an individual from the database.
+
+    Bulk version of `delete_enrollment`. The enrollments of `individual`
+    in `group` are given in `periods` as `(id, start, end)` tuples,
+    like the ones returned by `search_enrollment_periods`. All of
+    them are removed using a single query.
+
+    :param trxl: TransactionsLog object from the method calling this one
+    :param individual: individual whose enrollments will be removed
+    :param group: group of the enrollments
+    :param periods: list of `(id, start, end)` tuples of the enrollments
+        to remove
+
+    :raises LockedIdentityError: when the individual is locked
+    """
+    if individual.is_locked:
+        raise LockedIdentityError(uuid=individual.mk)
+
+    if not periods:
+        return
+
+    operations = []
+
+    for _, start, end in periods:
+        op_args = {
+            'mk': individual.mk,
+            'group': group.name,
+            'start': str(start),
+            'end': str(end)
+        }
+        operations.append({
+            'op_type': Operation.OpType.DELETE,
+            'entity_type': 'enrollment',
+            'timestamp': datetime_utcnow(),
+            'args': op_args,
+            'target': op_args['mk']
+        })
+
+    Enrollment.objects.filter(pk__in=[pk for pk, _, _ in periods]).delete()
+    individual.save()
+
+    trxl.log_operations(operations, batch_size=BULK_BATCH_SIZE)
+
+
 def move_identity(trxl, identity, individual):
     """Move an identity to an individual.
 
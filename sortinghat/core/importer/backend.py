@@ -31,6 +31,7 @@ from ..errors import (LoadError,
                       DuplicateRangeError)
 from ..importer.utils import find_backends
 from ..models import MIN_PERIOD_DATE, MAX_PERIOD_DATE
+from ...utils import generate_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -79,14 +80,21 @@ class IdentitiesImporter:
         individuals = self.get_individuals()
 
         total = 0
-        for individual in individuals:
-            uuid, nidentities = self.__load_identities(individual.identities)
-            if uuid:
-                self.__load_enrollments(individual.enrollments, uuid)
-            if uuid and individual.profile:
-                # Use the profile defined in the individual
-                self.__load_profile(individual.profile, uuid)
-            total += nidentities
+        try:
+            for individual in individuals:
+                uuid, nidentities = self.__load_identities(individual.identities)
+                if uuid:
+                    self.__load_enrollments(individual.enrollments, uuid)
+                if uuid and individual.profile:
+                    # Use the profile defined in the individual
+                    self.__load_profile(individual.profile, uuid)
+                total += nidentities
+        finally:
+            # Release the UUIDs cached during the load, even when it
+            # fails. The cache is shared by every caller of the process
+            # (i.e. GraphQL, jobs or recommenders), so they lose their
+            # cached UUIDs too; they will be generated again on demand.
+            generate_uuid.cache_clear()
 
         logger.info("Individuals loaded")
         return total
@@ -19,13 +19,22 @@
 #     Jose Javier Merchante <jjmerchante@bitergia.com>
 #
 
+from concurrent.futures import ProcessPoolExecutor
 from urllib.request import urlopen
 
+import collections
 import dateutil.parser
 import dateutil.tz
+import functools
+import io
+import itertools
 import logging
+import multiprocessing
+import os
 import re
 
+from django.conf import settings
+
 from ..backend import IdentitiesImporter
 from sortinghat.core.importer.models import (Individual,
                                              Identity,
@@ -37,6 +46,14 @@ from sortinghat.core.models import MIN_PERIOD_DATE, MAX_PERIOD_DATE
 logger = logging.getLogger(__name__)
 
 
+# Number of lines parsed by each process when
+# `SORTINGHAT_PARALLEL_PARSE` is enabled
+PARALLEL_PARSE_CHUNK_SIZE = 10000
+# Maximum number of chunks waiting to be parsed or
+# consumed per available CPU
+PARALLEL_PARSE_PENDING_PER_CPU = 2
+
+
 class GitdmImporter(IdentitiesImporter):
 
     NAME = 'gitdm'
@@ -86,6 +103,17 @@ class GitdmParser(object):
     are the name of the organizations and each organization object is
     related to a list of domains.
 
+    Streams can be given as strings, bytes (UTF-8 encoded) or
+    file-like objects in text mode. Lines are read one by one,
+    so the whole stream is never split in memory.
+
+    When `SORTINGHAT_PARALLEL_PARSE` setting is enabled, large
+    streams are split in chunks of lines that are parsed by a
+    pool of processes shared by all the streams of the parser.
+    Workers are started with the 'fork' method; where it is not
+    available, streams are parsed sequentially. Check
+    `parse_parallel` for more info.
+
     :param aliases: aliases stream
     :param email_to_employer: enrollments stream
     :param domain_to_employer: organizations stream
@@ -104,6 +132,20 @@ class GitdmParser(object):
     DOMAIN_REGEX = r"^(?P<domain>\w\S+)$"
     ENROLLMENT_REGEX = r"^(?P<organization>[^#<\n\r\f\v]*[^#<\t\n\r\f\v\s])(?:[ \t]+<[ \t]+(?P<date>\d{4}\-\d{2}\-\d{2}))?$"
 
+    # Compiled once, when the class is loaded
+    _VALID_LINE_RE = re.compile(VALID_LINE_REGEX, re.UNICODE)
+    _EMAIL_ADDRESS_RE = re.compile(EMAIL_ADDRESS_REGEX, re.UNICODE)
+    _ORGANIZATION_RE = re.compile(ORGANIZATION_REGEX, re.UNICODE)
+    _DOMAIN_RE = re.compile(DOMAIN_REGEX, re.UNICODE)
+    _ENROLLMENT_RE = re.compile(ENROLLMENT_REGEX, re.UNICODE)
+
+    # Methods that parse the lines of each type of stream
+    _LINE_PARSERS = {
+        'aliases': '_parse_aliases_line',
+        'email_to_employer': '_parse_email_to_employer_line',
+        'domain_to_employer': '_parse_domain_to_employer_line'
+    }
+
     def __init__(self, aliases=None, email_to_employer=None, domain_to_employer=None,
                  source='gitdm', email_validation=True):
         self._individuals = {}
@@ -116,8 +158,36 @@ class GitdmParser(object):
         self.__raw_aliases = {}
         self.__raw_orgs = {}
 
-        self.__parse(aliases, email_to_employer,
-                     domain_to_employer)
+        # Pool of processes shared by the streams of this parser
+        self._executor = None
+
+        streams = (aliases, email_to_employer, domain_to_employer)
+        parallel = getattr(settings, 'SORTINGHAT_PARALLEL_PARSE', False)
+
+        # Workers are forked, so they inherit the Django setup of
+        # this process; the parser runs sequentially on platforms
+        # where 'fork' is not available
+        mp_context = self.__fork_context() if parallel and any(streams) else None
+
+        if mp_context:
+            with ProcessPoolExecutor(mp_context=mp_context) as executor:
+                self._executor = executor
+                try:
+                    self.__parse(aliases, email_to_employer,
+                                 domain_to_employer)
+                finally:
+                    self._executor = None
+        else:
+            self.__parse(aliases, email_to_employer,
+                         domain_to_employer)
+
+    @staticmethod
+    def __fork_context():
+        try:
+            return multiprocessing.get_context('fork')
+        except ValueError:
+            logger.warning("'fork' start method not available; parsing sequentially")
+            return None
 
     @property
     def individuals(self):
@@ -147,7 +217,7 @@ class GitdmParser(object):
 
             if not individual:
                 individual = Individual(uuid=email)
-                e = re.match(self.EMAIL_ADDRESS_REGEX, email, re.UNICODE)
+                e = self._EMAIL_ADDRESS_RE.match(email)
                 if e:
                     identity = Identity(email=email, source=self.source)
                 else:
@@ -158,7 +228,7 @@ class GitdmParser(object):
                 self._individuals[email] = individual
 
             # Create identity with alias
-            e = re.match(self.EMAIL_ADDRESS_REGEX, alias, re.UNICODE)
+            e = self._EMAIL_ADDRESS_RE.match(alias)
             if e:
                 identity = Identity(email=alias, source=self.source)
             else:
@@ -230,9 +300,7 @@ class GitdmParser(object):
         if not stream:
             return
 
-        f = self.__parse_aliases_line
-
-        for alias_entries in self.__parse_stream(stream, f):
+        for alias_entries in self.__parse_stream(stream, 'aliases'):
             alias = alias_entries[0]
             username = alias_entries[1]
 
@@ -257,9 +325,7 @@ class GitdmParser(object):
         if not stream:
             return
 
-        f = self.__parse_email_to_employer_line
-
-        for rol in self.__parse_stream(stream, f):
+        for rol in self.__parse_stream(stream, 'email_to_employer'):
             email = rol[0]
             org = rol[1]
             rol_date = rol[2]
@@ -291,9 +357,7 @@ class GitdmParser(object):
         if not stream:
             return
 
-        f = self.__parse_domain_to_employer_line
-
-        for o in self.__parse_stream(stream, f):
+        for o in self.__parse_stream(stream, 'domain_to_employer'):
             org = o[0]
             dom = o[1]
 
@@ -302,60 +366,174 @@ class GitdmParser(object):
 
             self.__raw_orgs[org].append(dom)
 
-    def __parse_stream(self, stream, parse_line):
+    def __parse_stream(self, stream, stream_type):
         """Generic method to parse gitdm streams"""
 
         if not stream:
             raise InvalidFormatError(cause='stream cannot be empty or None')
 
-        nline = 0
-        lines = stream.split('\n')
+        if isinstance(stream, bytes):
+            stream = stream.decode('utf-8')
+        if isinstance(stream, str):
+            stream = io.StringIO(stream, newline='\n')
+
+        if self._executor is not None:
+            yield from self.parse_parallel(stream, stream_type, self._executor)
+        else:
+            yield from self._parse_lines(stream, self.__line_parser(stream_type))
+
+    def __line_parser(self, stream_type):
+        """Return the function that parses the lines of a stream type"""
+
+        parse_line = getattr(type(self), self._LINE_PARSERS[stream_type])
+        return functools.partial(parse_line, email_validation=self.email_validation)
+
+    def parse_parallel(self, lines, stream_type, executor, chunk_size=None):
+        """Parse a sequence of lines using a pool of processes.
+
+        Lines are read in chunks of `chunk_size` lines and each
+        chunk is submitted to `executor` as soon as it is read.
+        The number of chunks waiting to be parsed or consumed is
+        bounded, so the stream is never fully loaded in memory.
+        Results are returned in the same order of the lines, so
+        they are the same the sequential parser returns. Streams
+        that fit in a single chunk are parsed in this process.
+
+        :param lines: iterable of lines
+        :param stream_type: type of the stream; any key of
+            `_LINE_PARSERS`
+        :param executor: pool of processes used to parse the chunks
+        :param chunk_size: number of lines of each chunk; by default,
+            `PARALLEL_PARSE_CHUNK_SIZE`
+
+        :returns: a generator of parsed lines
+        """
+        chunk_size = chunk_size or PARALLEL_PARSE_CHUNK_SIZE
+        max_pending = PARALLEL_PARSE_PENDING_PER_CPU * (os.cpu_count() or 1)
+
+        it = iter(lines)
+        first_chunk = list(itertools.islice(it, chunk_size))
+        second_chunk = list(itertools.islice(it, chunk_size))
+
+        parse_line = self.__line_parser(stream_type)
+
+        if not second_chunk:
+            yield from self._parse_lines(first_chunk, parse_line)
+            return
+
+        chunks = itertools.chain(
+            [first_chunk, second_chunk],
+            iter(lambda: list(itertools.islice(it, chunk_size)), [])
+        )
+
+        pending = collections.deque()
+        nline = 1
+
+        for chunk in chunks:
+            future = executor.submit(_parse_chunk, type(self), parse_line,
+                                     chunk, nline)
+            pending.append(future)
+            nline += len(chunk)
+
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
 
-        for line in lines:
-            nline += 1
+    @classmethod
+    def _parse_lines(cls, lines, parse_line, first_nline=1):
+        """Parse lines; `first_nline` is the number of the first one"""
 
-            # Ignore blank lines and comments
-            m = re.match(self.LINES_TO_IGNORE_REGEX, line, re.UNICODE)
-            if m:
+        for nline, raw_line in enumerate(lines, first_nline):
+            line = raw_line.rstrip('\n')
+
+            # Ignore blank lines and comments; this is the same
+            # as matching LINES_TO_IGNORE_REGEX but cheaper
+            stripped = line.lstrip()
+            if not stripped or stripped[0] == '#':
                 continue
 
-            m = re.match(self.VALID_LINE_REGEX, line, re.UNICODE)
-            if not m:
+            fields = cls._split_line(line)
+            if not fields:
                 cause = "Skip: '%s' -> line %s: invalid line format" % (line, str(nline))
                 logger.warning(cause)
                 continue
 
             try:
-                result = parse_line(m.group(1), m.group(2))
+                result = parse_line(*fields)
                 yield result
             except InvalidFormatError as e:
                 cause = "Skip: '%s' -> line %s: %s" % (line, str(nline), e)
                 logger.warning(cause)
                 continue
 
-    def __parse_aliases_line(self, raw_alias, raw_username):
+    @classmethod
+    def _split_line(cls, line):
+        """Split a line in its two fields.
+
+        String based version of `VALID_LINE_REGEX`. It returns the
+        same groups the regular expression does or `None` when the
+        line is not valid. The most common formats, with or without
+        a trailing comment, are split without running any regular
+        expression; any other line is checked using the expression.
+        """
+        parts = line.split(None, 1)
+        if len(parts) != 2 or line[0].isspace():
+            return cls.__match_line(line)
+
+        field, value = parts
+
+        # Fields can only be separated by spaces or tabs
+        sep = line[len(field):len(line) - len(value)]
+        if sep.strip(' \t'):
+            return cls.__match_line(line)
+
+        if '\r' in value or '\f' in value or '\v' in value:
+            return cls.__match_line(line)
+
+        pos = value.find('#')
+        if pos < 0:
+            return field, value
+        elif pos > 1 and value[pos - 1] in ' \t':
+            # Only the separator just before the comment is removed
+            return field, value[:pos - 1]
+        else:
+            return cls.__match_line(line)
+
+    @classmethod
+    def __match_line(cls, line):
+        m = cls._VALID_LINE_RE.match(line)
+        return (m.group(1), m.group(2)) if m else None
+
+    # Line parsers are class methods that share the same signature,
+    # so they can run in worker processes without an instance
+
+    @classmethod
+    def _parse_aliases_line(cls, raw_alias, raw_username, email_validation=True):
         """Parse aliases lines"""
 
-        alias = self.__encode(raw_alias)
-        username = self.__encode(raw_username)
+        alias = cls.__encode(raw_alias)
+        username = cls.__encode(raw_username)
 
         return alias, username
 
-    def __parse_email_to_employer_line(self, raw_email, raw_enrollment):
+    @classmethod
+    def _parse_email_to_employer_line(cls, raw_email, raw_enrollment, email_validation=True):
         """Parse email to employer lines"""
 
-        e = re.match(self.EMAIL_ADDRESS_REGEX, raw_email, re.UNICODE)
-        if not e and self.email_validation:
+        e = cls._EMAIL_ADDRESS_RE.match(raw_email)
+        if not e and email_validation:
             cause = "invalid email format: '%s'" % raw_email
             raise InvalidFormatError(cause=cause)
 
-        if self.email_validation:
+        if email_validation:
             email = e.group('email').strip()
         else:
             email = raw_email
 
         raw_enrollment = raw_enrollment.strip() if raw_enrollment != ' ' else raw_enrollment
-        r = re.match(self.ENROLLMENT_REGEX, raw_enrollment, re.UNICODE)
+        r = cls._ENROLLMENT_RE.match(raw_enrollment)
         if not r:
             cause = "invalid enrollment format: '%s'" % raw_enrollment
             raise InvalidFormatError(cause=cause)
@@ -374,15 +552,16 @@ class GitdmParser(object):
         else:
             dt = MAX_PERIOD_DATE
 
-        email = self.__encode(email)
-        org = self.__encode(org)
+        email = cls.__encode(email)
+        org = cls.__encode(org)
 
         return email, org, dt
 
-    def __parse_domain_to_employer_line(self, raw_domain, raw_org):
+    @classmethod
+    def _parse_domain_to_employer_line(cls, raw_domain, raw_org, email_validation=True):
         """Parse domain to employer lines"""
 
-        d = re.match(self.DOMAIN_REGEX, raw_domain, re.UNICODE)
+        d = cls._DOMAIN_RE.match(raw_domain)
         if not d:
             cause = "invalid domain format: '%s'" % raw_domain
             raise InvalidFormatError(cause=cause)
@@ -390,17 +569,24 @@ class GitdmParser(object):
         dom = d.group('domain').strip()
 
         raw_org = raw_org.strip() if raw_org != ' ' else raw_org
-        o = re.match(self.ORGANIZATION_REGEX, raw_org, re.UNICODE)
+        o = cls._ORGANIZATION_RE.match(raw_org)
         if not o:
             cause = "invalid organization format: '%s'" % raw_org
             raise InvalidFormatError(cause=cause)
 
         org = o.group('organization').strip()
 
-        org = self.__encode(org)
-        dom = self.__encode(dom)
+        org = cls.__encode(org)
+        dom = cls.__encode(dom)
 
         return org, dom
 
-    def __encode(self, s):
+    @staticmethod
+    def __encode(s):
         return s if s else None
+
+
+def _parse_chunk(parser_cls, parse_line, lines, first_nline):
+    """Parse a chunk of lines in a worker process"""
+
+    return list(parser_cls._parse_lines(lines, parse_line, first_nline))
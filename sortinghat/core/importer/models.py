@@ -19,8 +19,13 @@
 #     Jose Javier Merchante <jjmerchante@bitergia.com>
 #
 
+# Importers may create hundreds of thousands of these objects,
+# so they use '__slots__' to keep their memory footprint low.
+
 
 class Identity:
+    __slots__ = ('source', 'name', 'username', 'email', 'uuid')
+
     def __init__(self, source, name=None, email=None, username=None, uuid=None):
         self.source = source
         self.name = name
@@ -30,6 +35,8 @@ class Identity:
 
 
 class Individual:
+    __slots__ = ('uuid', 'identities', 'enrollments', 'profile')
+
     def __init__(self, uuid=None, profile=None):
         self.uuid = uuid
         self.identities = []
@@ -39,6 +46,8 @@ class Individual:
 
 
 class Profile:
+    __slots__ = ('name', 'email', 'gender', 'gender_acc', 'is_bot', 'country_code')
+
     def __init__(self, name=None, email=None, gender=None, gender_acc=None,
                  is_bot=False, country_code=None):
         self.name = name
@@ -50,6 +59,8 @@ class Profile:
 
 
 class Enrollment:
+    __slots__ = ('start', 'end', 'organization')
+
     def __init__(self, organization, start=None, end=None):
         self.start = start
         self.end = end
@@ -57,6 +68,8 @@ class Enrollment:
 
 
 class Organization:
+    __slots__ = ('name', 'type', 'domains', 'parent_org')
+
     def __init__(self, name=None, type=None, parent_org=None):
         self.name = name
         self.type = type
@@ -65,11 +78,15 @@ class Organization:
 
 
 class Domain:
+    __slots__ = ('domain', 'is_top_domain')
+
     def __init__(self, domain, is_top_domain=False):
         self.domain = domain
         self.is_top_domain = is_top_domain
 
 
 class RecommenderExclusionTerm:
+    __slots__ = ('term',)
+
     def __init__(self, term):
         self.term = term
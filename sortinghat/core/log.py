@@ -148,10 +148,62 @@ class TransactionsLog:
 
         :returns: a new Operation object
         """
+        self._check_is_open()
+
+        operation = self._new_operation(op_type, entity_type, timestamp, args, target)
+
+        try:
+            operation.save(force_insert=True)
+        except django.db.utils.IntegrityError as exc:
+            _handle_integrity_error(Operation, exc, self.trx.tuid)
+
+        logger.debug(
+            f"Operation {operation.ouid} completed; "
+            f"trx='{operation.trx.tuid}' op='{operation.op_type}' "
+            f"type='{entity_type}' target='{target}' args={args};"
+        )
+
+        return operation
+
+    def log_operations(self, operations, batch_size=None):
+        """Create a set of operation objects and save them into the DB.
+
+        Bulk version of `log_operation`. Each item of `operations` is
+        a dict with the same parameters `log_operation` receives:
+        `op_type`, `entity_type`, `timestamp`, `args` and `target`.
+        Operations are inserted using bulk queries.
+
+        :param operations: list of operations to record
+        :param batch_size: maximum number of operations inserted
+            on each query; by default, all of them
+
+        :raises ClosedTransactionError: When trying to log an operation on a closed transaction
+        :raises TypeError: When the `op_type` is not an instance of `Operation.OpType` class
+
+        :returns: a list of new Operation objects
+        """
+        self._check_is_open()
+
+        new_operations = [self._new_operation(**op) for op in operations]
+
+        try:
+            Operation.objects.bulk_create(new_operations, batch_size=batch_size)
+        except django.db.utils.IntegrityError as exc:
+            _handle_integrity_error(Operation, exc, self.trx.tuid)
+
+        logger.debug(
+            f"{len(new_operations)} operations completed; "
+            f"trx='{self.trx.tuid}'"
+        )
+
+        return new_operations
+
+    def _check_is_open(self):
         if self.trx.is_closed:
             msg = 'Log operation not allowed, transaction {} is already closed'.format(self.trx.tuid)
             raise ClosedTransactionError(msg=msg)
 
+    def _new_operation(self, op_type, entity_type, timestamp, args, target):
         # Check if input values are valid
         validate_field('entity_type', entity_type)
         validate_field('target', target)
@@ -163,21 +215,8 @@ class TransactionsLog:
 
         ouid = uuid.uuid4().hex
 
-        operation = Operation(ouid=ouid, trx=self.trx, op_type=op_type, target=target,
-                              entity_type=entity_type, timestamp=timestamp, args=args_dump)
-
-        try:
-            operation.save(force_insert=True)
-        except django.db.utils.IntegrityError as exc:
-            _handle_integrity_error(Operation, exc, self.trx.tuid)
-
-        logger.debug(
-            f"Operation {operation.ouid} completed; "
-            f"trx='{operation.trx.tuid}' op='{operation.op_type}' "
-            f"type='{entity_type}' target='{target}' args={args};"
-        )
-
-        return operation
+        return Operation(ouid=ouid, trx=self.trx, op_type=op_type, target=target,
+                         entity_type=entity_type, timestamp=timestamp, args=args_dump)
 
 
 _MYSQL_DUPLICATE_ENTRY_ERROR_REGEX = re.compile(r"Duplicate entry '(?P<value>.+)' for key")
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 20:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_alter_individual_options_individual_last_reviewed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='identity',
+            index=models.Index(fields=['source', 'email', 'name', 'username'], name='ident_fields_idx'),
+        ),
+    ]
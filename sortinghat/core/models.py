@@ -32,7 +32,8 @@ from django.db.models import (CASCADE,
                               DateTimeField,
                               PositiveIntegerField,
                               ForeignKey,
-                              OneToOneField)
+                              OneToOneField,
+                              Index)
 
 from django.db.models import JSONField
 from django.conf import settings
@@ -43,7 +44,9 @@ from grimoirelab_toolkit.datetime import datetime_utcnow
 
 from treebeard.mp_tree import MP_Node, MP_NodeQuerySet
 
-# Default dates for periods
+# Default dates for periods. They use the same `tzutc` instance
+# returned by `datetime_to_utc`, so comparing them with converted
+# dates doesn't need to call `utcoffset()`.
 MIN_PERIOD_DATE = datetime.datetime(1900, 1, 1, 0, 0, 0,
                                     tzinfo=dateutil.tz.tzutc())
 MAX_PERIOD_DATE = datetime.datetime(2100, 1, 1, 0, 0, 0,
@@ -265,6 +268,10 @@ class Identity(EntityBase):
     class Meta:
         db_table = 'identities'
         unique_together = ('name', 'email', 'username', 'source', )
+        indexes = [
+            Index(fields=['source', 'email', 'name', 'username'],
+                  name='ident_fields_idx'),
+        ]
 
     def __str__(self):
         return self.uuid
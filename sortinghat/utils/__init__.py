@@ -16,10 +16,18 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 
-import hashlib
+import functools
 import unicodedata
 
+from hashlib import sha1
 
+
+# Maximum number of entries kept by the functions cache
+UNACCENT_CACHE_SIZE = 65536
+UUID_CACHE_SIZE = 131072
+
+
+@functools.lru_cache(maxsize=UNACCENT_CACHE_SIZE)
 def unaccent_string(unistr):
     """Convert a Unicode string to its canonical form without accents.
 
@@ -28,6 +36,9 @@ def unaccent_string(unistr):
     characters 'Ê, ê, é, ë' are considered the same character as 'e';
     characters 'Ĉ, ć' are the same as 'c'.
 
+    Results are cached because the same names are unaccented
+    many times when identities are loaded in bulk.
+
     :param unistr: Unicode string to unaccent
 
     :returns: Unicode string on its canonical form
@@ -43,6 +54,7 @@ def unaccent_string(unistr):
     return string
 
 
+@functools.lru_cache(maxsize=UUID_CACHE_SIZE)
 def generate_uuid(source, email=None, name=None, username=None):
     """Generate a UUID related to identity data.
 
@@ -64,6 +76,15 @@ def generate_uuid(source, email=None, name=None, username=None):
         ('scm', 'jsmith@example.com', 'John Smith', 'JSMITH'),
         ('scm', 'jsmith@example.com', 'john Smith', 'jsmith')
 
+    The string is encoded as UTF-8. Bytes escaped with the
+    'surrogateescape' error handler (i.e. '\\udcc5') are encoded
+    back to their original values; any other surrogate char
+    raises a `UnicodeEncodeError`.
+
+    The function is pure, so the UUIDs are cached. Call
+    `generate_uuid.cache_clear()` to release the memory once
+    a bulk load finishes.
+
     :param source: data source
     :param email: email of the identity
     :param name: full name of the identity
@@ -73,14 +94,15 @@ def generate_uuid(source, email=None, name=None, username=None):
 
     :raises ValueError: when source is `None` or empty; each one
         of the parameters is `None`; or the parameters are empty.
+    :raises TypeError: when any of the parameters is not a string
+        or `None`
     """
-    def to_str(value, unaccent=False):
-        s = str(value)
-        if unaccent:
-            return unaccent_string(s)
-        else:
-            return s
+    _validate_identity_data(source, email, name, username)
+
+    return _hash_identity_data(source, email, name, username)
 
+
+def _validate_identity_data(source, email, name, username):
     if source is None:
         raise ValueError("'source' cannot be None")
     if source == '':
@@ -88,13 +110,35 @@ def generate_uuid(source, email=None, name=None, username=None):
     if not (email or name or username):
         raise ValueError("identity data cannot be empty")
 
-    s = ':'.join((to_str(source),
-                  to_str(email),
-                  to_str(name, unaccent=True),
-                  to_str(username))).lower()
-    s = s.encode('UTF-8', errors="surrogateescape")
-
-    sha1 = hashlib.sha1(s)
-    uuid = sha1.hexdigest()
 
-    return uuid
+def _hash_identity_data(source, email, name, username):
+    """Return the SHA1 of the identity data"""
+
+    # The fields are joined and lowered as a single string and hashed
+    # with one call. Lowering each field on its own is not equivalent:
+    # the lowercase form of 'Σ' depends on the character that follows
+    # it, so that would change the UUIDs already stored. Feeding the
+    # fields one by one to the hash object is also slower than
+    # hashing one buffer.
+    #
+    # `None` values are hashed as 'None', like the former str()
+    # conversion did, so the UUIDs do not change.
+    try:
+        s = ':'.join((source,
+                      'None' if email is None else email,
+                      'None' if name is None else unaccent_string(name),
+                      'None' if username is None else username)).lower()
+    except TypeError:
+        msg = "identity data must be strings or None"
+        raise TypeError(msg) from None
+
+    # Most of the strings are valid UTF-8, so try the default
+    # encoder first. Strings with escaped bytes (i.e. '\udcc5')
+    # can come from data read with 'surrogateescape'; those
+    # are encoded back to their original bytes.
+    try:
+        b = s.encode()
+    except UnicodeEncodeError:
+        b = s.encode('UTF-8', errors="surrogateescape")
+
+    return sha1(b).hexdigest()
@@ -20,6 +20,8 @@
 #     Jose Javier Merchante <jjmerchante@bitergia.com>
 #
 
+import unittest.mock
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
@@ -28,6 +30,7 @@ from sortinghat.core.importer.backend import IdentitiesImporter
 from sortinghat.core.models import Individual, Identity
 from sortinghat.core.importer.models import (Individual as ImpIndividual,
                                              Identity as ImpIdentity)
+from sortinghat.utils import generate_uuid
 
 
 class MockedIdentitiesImporter(IdentitiesImporter):
@@ -128,3 +131,18 @@ class TestBackend(TestCase):
         self.assertEqual(indiv.identities.first(), identity)
         self.assertEqual(identity.source, 'test_backend')
         self.assertEqual(identity.username, 'test_user')
+
+    def test_uuid_cache_cleared_on_error(self):
+        """Test whether the UUIDs cache is released when the import fails"""
+
+        generate_uuid('scm', email='jsmith@example.com')
+        self.assertGreater(generate_uuid.cache_info().currsize, 0)
+
+        importer = MockedIdentitiesImporter(self.ctx, 'foo.url')
+
+        with unittest.mock.patch('sortinghat.core.api.add_identity',
+                                 side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                importer.import_identities()
+
+        self.assertEqual(generate_uuid.cache_info().currsize, 0)
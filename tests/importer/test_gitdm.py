@@ -20,13 +20,15 @@
 #
 
 import datetime
+import io
 import os
 import re
 import unittest.mock
 
+from concurrent.futures import ProcessPoolExecutor
 from dateutil.tz import tzutc
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from sortinghat.core.context import SortingHatContext
 from sortinghat.core.importer.backends.gitdm import GitdmImporter, GitdmParser
@@ -42,6 +44,17 @@ def read_file(filename, mode='r'):
     return content
 
 
+def parser_summary(parser):
+    """Summarize the individuals parsed to compare them"""
+
+    return [
+        (individual.uuid,
+         [identity.email for identity in individual.identities],
+         [(enr.organization.name, enr.start, enr.end) for enr in individual.enrollments])
+        for individual in parser.individuals
+    ]
+
+
 def mock_fetch(cls, url):
     if url == 'valid_aliases':
         return read_file('data/gitdm/gitdm_email_aliases_valid.txt')
@@ -337,6 +350,62 @@ class TestGitdmImporter(TestCase):
         self.assertEqual(org.start, MIN_PERIOD_DATE)
         self.assertEqual(org.end, datetime.datetime(2015, 1, 1, tzinfo=tzutc()))
 
+    def test_stream_types(self):
+        """Test whether the parser reads strings, bytes and file-like streams"""
+
+        aliases = read_file('data/gitdm/gitdm_email_aliases_valid.txt')
+        data = read_file('data/gitdm/gitdm_email_to_employer_valid.txt')
+
+        expected = parser_summary(GitdmParser(aliases=aliases, email_to_employer=data))
+        self.assertEqual(len(expected), 4)
+
+        parser = GitdmParser(aliases=aliases.encode('utf-8'),
+                             email_to_employer=data.encode('utf-8'))
+        self.assertListEqual(parser_summary(parser), expected)
+
+        parser = GitdmParser(aliases=io.StringIO(aliases),
+                             email_to_employer=io.StringIO(data))
+        self.assertListEqual(parser_summary(parser), expected)
+
+    @unittest.mock.patch('sortinghat.core.importer.backends.gitdm.PARALLEL_PARSE_CHUNK_SIZE', 2)
+    def test_parallel_parse(self):
+        """Test whether parsing in parallel returns the same data"""
+
+        aliases = read_file('data/gitdm/gitdm_email_aliases_valid.txt')
+        data = read_file('data/gitdm/gitdm_email_to_employer_valid.txt')
+
+        expected = parser_summary(GitdmParser(aliases=aliases, email_to_employer=data))
+        self.assertEqual(len(expected), 4)
+
+        with override_settings(SORTINGHAT_PARALLEL_PARSE=True):
+            with unittest.mock.patch('sortinghat.core.importer.backends.gitdm.ProcessPoolExecutor',
+                                     wraps=ProcessPoolExecutor) as mock_executor:
+                parser = GitdmParser(aliases=aliases, email_to_employer=data)
+
+                # A single pool of forked processes is shared by all the streams
+                mock_executor.assert_called_once()
+                mp_context = mock_executor.call_args.kwargs['mp_context']
+                self.assertEqual(mp_context.get_start_method(), 'fork')
+
+        self.assertListEqual(parser_summary(parser), expected)
+
+    @unittest.mock.patch('sortinghat.core.importer.backends.gitdm.PARALLEL_PARSE_CHUNK_SIZE', 2)
+    def test_parallel_parse_no_fork(self):
+        """Test whether streams are parsed sequentially when fork is not available"""
+
+        aliases = read_file('data/gitdm/gitdm_email_aliases_valid.txt')
+        data = read_file('data/gitdm/gitdm_email_to_employer_valid.txt')
+
+        expected = parser_summary(GitdmParser(aliases=aliases, email_to_employer=data))
+
+        with override_settings(SORTINGHAT_PARALLEL_PARSE=True), \
+                unittest.mock.patch('multiprocessing.get_context', side_effect=ValueError), \
+                unittest.mock.patch('sortinghat.core.importer.backends.gitdm.ProcessPoolExecutor') as mock_executor:
+            parser = GitdmParser(aliases=aliases, email_to_employer=data)
+            mock_executor.assert_not_called()
+
+        self.assertListEqual(parser_summary(parser), expected)
+
     @unittest.mock.patch.object(GitdmImporter, '_fetch_data', mock_fetch)
     def test_supress_email_validation(self):
         """Test whether the importer can supress email validation"""
@@ -528,6 +597,48 @@ class TestGitdmRegEx(unittest.TestCase):
         m = parser.match("domain organization\t   # comment\n\t")
         self.assertIsNone(m)
 
+    def test_split_line(self):
+        """Check whether lines are split like the valid line pattern does"""
+
+        parser = re.compile(GitdmParser.VALID_LINE_REGEX, re.UNICODE)
+
+        lines = [
+            "jdoe@example.com\tExample  Company\t# John Doe",
+            "jdoe@example.com\t\tExample < 2010-01-01\t\t# John Doe",
+            "jdoe@example.com\tExample  Company",
+            "jdoe@example.com\t\t\tjohndoe@example.com",
+            "example.org\t\tExample/n' Co. ",
+            "jdoe@example.org    Example",
+            "example.org\torganization\t### comment",
+            "jonhdoe@exampl.com\torganization\t#   \t\r",
+            "domain\torganization\t#\tcomment #1\r",
+            "example.org\tExamplé",
+            "example.org\tExample  \t# comment",
+            "jdoe@example.org\tjdoe@exa\tmple.com",
+            "jdoe@example.org\t\t\t# comment",
+            "jdoe@example.org  ",
+            "example.org\tExample#comment",
+            "example.org\xa0Example",
+            "example.org\tExa\rmple",
+            "\texample.org\t\tExample",
+            "   example.org   Example",
+            "example.org"
+        ]
+
+        for line in lines:
+            m = parser.match(line)
+            expected = (m.group(1), m.group(2)) if m else None
+            self.assertEqual(GitdmParser._split_line(line), expected)
+
+        fields = GitdmParser._split_line("jdoe@example.com\tExample  Company\t# John Doe")
+        self.assertEqual(fields, ('jdoe@example.com', 'Example  Company'))
+
+        fields = GitdmParser._split_line("example.org\t\tExample/n' Co. ")
+        self.assertEqual(fields, ('example.org', "Example/n' Co. "))
+
+        fields = GitdmParser._split_line("   example.org   Example")
+        self.assertIsNone(fields)
+
     def test_lines_to_ignore(self):
         """Check whether it parses blank or comment lines"""
 
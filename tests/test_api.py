@@ -22,6 +22,7 @@
 
 import datetime
 import json
+import unittest.mock
 
 from dateutil.tz import UTC
 
@@ -3270,6 +3271,24 @@ class TestEnroll(TestCase):
         transactions = Transaction.objects.filter(created_at__gt=trx_date)
         self.assertEqual(len(transactions), 0)
 
+    @unittest.mock.patch('sortinghat.core.api._enroll')
+    def test_invalid_input_before_transaction(self, mock_enroll):
+        """Check if invalid inputs are rejected before the enrollment transaction starts"""
+
+        jsmith = api.add_identity(self.ctx, 'scm', email='jsmith@example')
+        api.add_organization(self.ctx, 'Example')
+
+        with self.assertRaises(InvalidValueError):
+            api.enroll(self.ctx,
+                       jsmith.uuid, 'Example',
+                       from_date=datetime.datetime(2001, 1, 1),
+                       to_date=datetime.datetime(1999, 1, 1))
+
+        with self.assertRaises(NotFoundError):
+            api.enroll(self.ctx, jsmith.uuid, 'Bitergia')
+
+        mock_enroll.assert_not_called()
+
     def test_period_out_of_bounds(self):
         """Check whether enrollments cannot be added giving periods out of bounds"""
 
@@ -3396,6 +3415,32 @@ class TestEnroll(TestCase):
                        from_date=datetime.datetime(1999, 1, 1),
                        to_date=datetime.datetime(2000, 1, 1))
 
+    def test_locked_while_checking_inputs(self):
+        """Check if it fails when the individual is locked after the inputs are checked"""
+
+        jsmith = api.add_identity(self.ctx, 'scm', email='jsmith@example')
+        api.add_organization(self.ctx, 'Example')
+
+        find_group = api.find_group
+
+        def lock_and_find_group(group, parent_org):
+            # Another request locks the individual in the meantime
+            Individual.objects.filter(mk=jsmith.uuid).update(is_locked=True)
+            return find_group(group, parent_org)
+
+        msg = UUID_LOCKED_ERROR.format(uuid=jsmith.uuid)
+        with unittest.mock.patch('sortinghat.core.api.find_group',
+                                 side_effect=lock_and_find_group):
+            with self.assertRaisesRegex(LockedIdentityError, msg):
+                api.enroll(self.ctx,
+                           jsmith.uuid, 'Example',
+                           from_date=datetime.datetime(1999, 1, 1),
+                           to_date=datetime.datetime(2000, 1, 1))
+
+        individual = Individual.objects.get(mk=jsmith.uuid)
+        self.assertEqual(individual.is_locked, True)
+        self.assertEqual(len(individual.enrollments.all()), 0)
+
     def test_transaction(self):
         """Check if a transaction is created when adding an enrollment"""
 
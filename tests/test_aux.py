@@ -22,7 +22,9 @@ from dateutil.tz import UTC
 
 from django.test import TestCase
 
-from sortinghat.core.aux import merge_datetime_ranges, validate_field
+from sortinghat.core.aux import (merge_datetime_ranges,
+                                 merge_datetime_ranges_np,
+                                 validate_field)
 
 CANT_COMPARE_DATES_ERROR = "can't compare offset-naive and offset-aware datetimes"
 DATE_OUT_OF_BOUNDS_ERROR = "'{type}' date {date} is out of bounds"
@@ -374,6 +376,73 @@ class TestMergeDatetimeRanges(TestCase):
             _ = [r for r in merge_datetime_ranges(dates)]
 
 
+class TestMergeDatetimeRangesNumpy(TestCase):
+    """Unit tests for merge_datetime_ranges_np function"""
+
+    def test_merge_datetime_ranges(self):
+        """Check if it returns the same ranges as merge_datetime_ranges"""
+
+        dates = [
+            (datetime.datetime(1900, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2010, 1, 2, tzinfo=UTC), datetime.datetime(2100, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2008, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2012, 1, 1, tzinfo=UTC), datetime.datetime(2011, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2010, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC))
+        ]
+
+        ranges = [r for r in merge_datetime_ranges_np(dates)]
+        expected = [
+            (datetime.datetime(1900, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2010, 1, 2, tzinfo=UTC), datetime.datetime(2100, 1, 1, tzinfo=UTC))
+        ]
+        self.assertListEqual(ranges, expected)
+
+        # Large sets of ranges are merged using numpy
+        dates = []
+        for year in range(1950, 2050):
+            dates.append((datetime.datetime(year, 1, 1, tzinfo=UTC),
+                          datetime.datetime(year, 6, 1, tzinfo=UTC)))
+            dates.append((datetime.datetime(year, 3, 1, tzinfo=UTC),
+                          datetime.datetime(year, 9, 1, tzinfo=UTC)))
+
+        ranges = [r for r in merge_datetime_ranges(dates)]
+        expected = [
+            (datetime.datetime(year, 1, 1, tzinfo=UTC), datetime.datetime(year, 9, 1, tzinfo=UTC))
+            for year in range(1950, 2050)
+        ]
+        self.assertListEqual(ranges, expected)
+
+    def test_empty_list_of_dates(self):
+        """Check if the result is empty when the list of ranges is empty"""
+
+        ranges = [r for r in merge_datetime_ranges_np([])]
+        self.assertEqual(ranges, [])
+
+    def test_dates_out_of_bounds(self):
+        """Check whether it raises an exception when dates are out of bounds"""
+
+        dates = [
+            (datetime.datetime(2008, 1, 1, tzinfo=UTC), datetime.datetime(2100, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(1800, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC))
+        ]
+
+        expected = DATE_OUT_OF_BOUNDS_ERROR.format(type='start',
+                                                   date=r'1800-01-01 00:00:00\+00:00')
+        with self.assertRaisesRegex(ValueError, expected):
+            _ = [r for r in merge_datetime_ranges_np(dates)]
+
+    def test_dates_no_timezone(self):
+        """Check whether it raises an exception when dates without timezone are given"""
+
+        dates = [
+            (datetime.datetime(2008, 1, 1), datetime.datetime(2100, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(1800, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC))
+        ]
+
+        with self.assertRaisesRegex(TypeError, CANT_COMPARE_DATES_ERROR):
+            _ = [r for r in merge_datetime_ranges_np(dates)]
+
+
 class TestValidateField(TestCase):
     """Unit tests for validate_field"""
 
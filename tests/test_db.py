@@ -128,6 +128,24 @@ class TestFindIndividual(TestCase):
         self.assertIsInstance(individual, Individual)
         self.assertEqual(individual.mk, mk)
 
+    def test_prefetch_enrollments(self):
+        """Test if the profile and the enrollments are fetched with the individual"""
+
+        mk = 'abcdefghijklmnopqrstuvwxyz'
+        individual = Individual.objects.create(mk=mk)
+        Profile.objects.create(individual=individual, name='John Smith')
+        org = Organization.add_root(name='Example')
+        Enrollment.objects.create(individual=individual, group=org)
+
+        with self.assertNumQueries(3):
+            individual = db.find_individual(mk, prefetch_enrollments=True)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(individual.profile.name, 'John Smith')
+            enrollments = individual.enrollments.all()
+            self.assertEqual(len(enrollments), 1)
+            self.assertEqual(enrollments[0].group.name, 'Example')
+
     def test_individual_not_found(self):
         """Test whether it raises an exception when the individual is not found"""
 
@@ -191,6 +209,10 @@ class TestFindIdentity(TestCase):
         self.assertIsInstance(identity, Identity)
         self.assertEqual(identity.uuid, mk)
 
+        # The individual is fetched with the identity
+        with self.assertNumQueries(0):
+            self.assertEqual(identity.individual.mk, mk)
+
     def test_identity_not_found(self):
         """Test whether it raises an exception when the identity is not found"""
 
@@ -597,6 +619,57 @@ class TestSearchEnrollmentsInPeriod(TestCase):
         self.assertEqual(rol.end, datetime.datetime(2008, 1, 1, tzinfo=UTC))
 
 
+class TestSearchEnrollmentPeriods(TestCase):
+    """Unit tests for search_enrollment_periods"""
+
+    def test_search_enrollment_periods(self):
+        """Test if the ids and periods of a set of enrollments are returned"""
+
+        individual_a = Individual.objects.create(mk='AAAA')
+        individual_b = Individual.objects.create(mk='BBBB')
+
+        example_org = Organization.add_root(name='Example')
+        bitergia_org = Organization.add_root(name='Bitergia')
+
+        Enrollment.objects.create(individual=individual_a, group=example_org,
+                                  start=datetime.datetime(1999, 1, 1, tzinfo=UTC),
+                                  end=datetime.datetime(2002, 1, 1, tzinfo=UTC))
+        enr1 = Enrollment.objects.create(individual=individual_a, group=example_org,
+                                         start=datetime.datetime(2003, 1, 1, tzinfo=UTC),
+                                         end=datetime.datetime(2005, 1, 1, tzinfo=UTC))
+        enr2 = Enrollment.objects.create(individual=individual_a, group=example_org,
+                                         start=datetime.datetime(2008, 1, 1, tzinfo=UTC),
+                                         end=datetime.datetime(2010, 1, 1, tzinfo=UTC))
+        Enrollment.objects.create(individual=individual_b, group=example_org,
+                                  start=datetime.datetime(2000, 1, 1, tzinfo=UTC),
+                                  end=datetime.datetime(2015, 1, 1, tzinfo=UTC))
+        Enrollment.objects.create(individual=individual_a, group=bitergia_org,
+                                  start=datetime.datetime(2001, 1, 1, tzinfo=UTC),
+                                  end=datetime.datetime(2010, 1, 1, tzinfo=UTC))
+
+        # Tests
+        periods = db.search_enrollment_periods('AAAA', 'Example',
+                                               from_date=datetime.datetime(2004, 1, 1, tzinfo=UTC),
+                                               to_date=datetime.datetime(2009, 1, 1, tzinfo=UTC))
+
+        expected = [
+            (enr1.pk, datetime.datetime(2003, 1, 1, tzinfo=UTC), datetime.datetime(2005, 1, 1, tzinfo=UTC)),
+            (enr2.pk, datetime.datetime(2008, 1, 1, tzinfo=UTC), datetime.datetime(2010, 1, 1, tzinfo=UTC))
+        ]
+        self.assertListEqual(periods, expected)
+
+    def test_no_enrollments_in_period(self):
+        """Test if an empty list is returned when there are not enrollments for a given period"""
+
+        Individual.objects.create(mk='AAAA')
+        Organization.add_root(name='Example')
+
+        periods = db.search_enrollment_periods('AAAA', 'Example',
+                                               from_date=datetime.datetime(2004, 1, 1, tzinfo=UTC),
+                                               to_date=datetime.datetime(2009, 1, 1, tzinfo=UTC))
+        self.assertListEqual(periods, [])
+
+
 class TestAddOrganization(TestCase):
     """Unit tests for add_organization"""
 
@@ -2464,6 +2537,125 @@ class TestAddEnrollment(TestCase):
         self.assertEqual(op1_args['end'], str(datetime_to_utc(datetime.datetime(2000, 1, 1))))
 
 
+class TestAddEnrollments(TestCase):
+    """Unit tests for add_enrollments"""
+
+    def setUp(self):
+        """Load initial dataset"""
+
+        self.user = get_user_model().objects.create(username='test')
+        self.ctx = SortingHatContext(self.user)
+
+        self.trxl = TransactionsLog.open('enroll', self.ctx)
+
+    def test_enroll(self):
+        """Check if a set of enrollments is added"""
+
+        mk = '1234567890ABCDFE'
+
+        individual = Individual.objects.create(mk=mk)
+        org = Organization.add_root(name='Example')
+
+        periods = [
+            (datetime.datetime(1999, 1, 1, tzinfo=UTC),
+             datetime.datetime(2000, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2005, 1, 1, tzinfo=UTC),
+             datetime.datetime(2006, 1, 1, tzinfo=UTC))
+        ]
+
+        enrollments = db.add_enrollments(self.trxl, individual, org, periods)
+        self.assertEqual(len(enrollments), 2)
+
+        enrollments = Enrollment.objects.filter(individual__mk=mk)
+        self.assertEqual(len(enrollments), 2)
+
+        enrollment = enrollments[0]
+        self.assertEqual(enrollment.start, datetime.datetime(1999, 1, 1, tzinfo=UTC))
+        self.assertEqual(enrollment.end, datetime.datetime(2000, 1, 1, tzinfo=UTC))
+        self.assertEqual(enrollment.individual.mk, mk)
+        self.assertEqual(enrollment.group.name, 'Example')
+
+        enrollment = enrollments[1]
+        self.assertEqual(enrollment.start, datetime.datetime(2005, 1, 1, tzinfo=UTC))
+        self.assertEqual(enrollment.end, datetime.datetime(2006, 1, 1, tzinfo=UTC))
+        self.assertEqual(enrollment.individual.mk, mk)
+        self.assertEqual(enrollment.group.name, 'Example')
+
+    def test_period_invalid(self):
+        """Check whether no enrollment is added when any of the periods is invalid"""
+
+        individual = Individual.objects.create(mk='1234567890ABCDFE')
+        org = Organization.add_root(name='Example')
+
+        periods = [
+            (datetime.datetime(1999, 1, 1, tzinfo=UTC),
+             datetime.datetime(2000, 1, 1, tzinfo=UTC)),
+            (datetime.datetime(2001, 1, 1, tzinfo=UTC),
+             datetime.datetime(1999, 1, 1, tzinfo=UTC))
+        ]
+
+        data = {
+            'start': r'2001-01-01 00:00:00\+00:00',
+            'end': r'1999-01-01 00:00:00\+00:00'
+        }
+        msg = PERIOD_INVALID_ERROR.format(**data)
+
+        with self.assertRaisesRegex(ValueError, msg):
+            db.add_enrollments(self.trxl, individual, org, periods)
+
+        enrollments = Enrollment.objects.all()
+        self.assertEqual(len(enrollments), 0)
+
+        # Check if operations have not been generated after the failure
+        operations = Operation.objects.all()
+        self.assertEqual(len(operations), 0)
+
+    def test_locked_individual(self):
+        """Check if if fails when the individual is locked"""
+
+        jsmith = Individual.objects.create(mk='AAAA', is_locked=True)
+        org = Organization.add_root(name='Example')
+        periods = [(datetime.datetime(1999, 1, 1, tzinfo=UTC),
+                    datetime.datetime(2000, 1, 1, tzinfo=UTC))]
+
+        msg = INDIVIDUAL_LOCKED_ERROR.format(mk='AAAA')
+        with self.assertRaisesRegex(LockedIdentityError, msg):
+            db.add_enrollments(self.trxl, jsmith, org, periods)
+
+    def test_operations(self):
+        """Check if the right operations are created"""
+
+        timestamp = datetime_utcnow()
+        mk = '1234567890ABCDFE'
+
+        individual = Individual.objects.create(mk=mk)
+        org = Organization.add_root(name='Example')
+
+        start = datetime.datetime(1999, 1, 1, tzinfo=UTC)
+        end = datetime.datetime(2000, 1, 1, tzinfo=UTC)
+
+        db.add_enrollments(self.trxl, individual, org, [(start, end)])
+
+        transactions = Transaction.objects.filter(name='enroll')
+        trx = transactions[0]
+
+        operations = Operation.objects.filter(trx=trx)
+        self.assertEqual(len(operations), 1)
+
+        op1 = operations[0]
+        self.assertEqual(op1.op_type, Operation.OpType.ADD.value)
+        self.assertEqual(op1.entity_type, 'enrollment')
+        self.assertEqual(op1.target, mk)
+        self.assertGreater(op1.timestamp, timestamp)
+
+        op1_args = json.loads(op1.args)
+        self.assertEqual(len(op1_args), 4)
+        self.assertEqual(op1_args['individual'], mk)
+        self.assertEqual(op1_args['group'], 'Example')
+        self.assertEqual(op1_args['start'], str(start))
+        self.assertEqual(op1_args['end'], str(end))
+
+
 class TestDeleteEnrollment(TestCase):
     """Unit tests for delete_enrollment"""
 
@@ -2610,6 +2802,126 @@ class TestDeleteEnrollment(TestCase):
         self.assertEqual(op1_args['end'], str(datetime_to_utc(to_date)))
 
 
+class TestDeleteEnrollments(TestCase):
+    """Unit tests for delete_enrollments"""
+
+    def setUp(self):
+        """Load initial dataset"""
+
+        self.user = get_user_model().objects.create(username='test')
+        self.ctx = SortingHatContext(self.user)
+
+        self.trxl = TransactionsLog.open('withdraw', self.ctx)
+
+    def test_delete_enrollments(self):
+        """Check whether it deletes a set of enrollments"""
+
+        from_date = datetime.datetime(1999, 1, 1, tzinfo=UTC)
+        first_period = datetime.datetime(2000, 1, 1, tzinfo=UTC)
+        second_period = datetime.datetime(2010, 1, 1, tzinfo=UTC)
+        to_date = datetime.datetime(2010, 1, 1, tzinfo=UTC)
+
+        jsmith = Individual.objects.create(mk='AAAA')
+
+        example_org = Organization.add_root(name='Example')
+        enrollment1 = Enrollment.objects.create(individual=jsmith, group=example_org,
+                                                start=from_date, end=first_period)
+        enrollment2 = Enrollment.objects.create(individual=jsmith, group=example_org,
+                                                start=second_period, end=to_date)
+
+        bitergia_org = Organization.add_root(name='Bitergia')
+        Enrollment.objects.create(individual=jsmith, group=bitergia_org,
+                                  start=first_period, end=second_period)
+
+        before_dt = datetime_utcnow()
+        periods = [(enrollment.pk, enrollment.start, enrollment.end)
+                   for enrollment in (enrollment1, enrollment2)]
+        db.delete_enrollments(self.trxl, jsmith, example_org, periods)
+        after_dt = datetime_utcnow()
+
+        # Tests
+        enrollments = Enrollment.objects.filter(group__name='Example')
+        self.assertEqual(len(enrollments), 0)
+
+        enrollments = Enrollment.objects.filter(group__name='Bitergia')
+        self.assertEqual(len(enrollments), 1)
+
+        jsmith = Individual.objects.get(mk='AAAA')
+        self.assertLessEqual(before_dt, jsmith.last_modified)
+        self.assertGreaterEqual(after_dt, jsmith.last_modified)
+
+    def test_locked_individual(self):
+        """Check if if fails when the individual is locked"""
+
+        jsmith = Individual.objects.create(mk='AAAA', is_locked=True)
+
+        org = Organization.add_root(name='Example')
+        enrollment = Enrollment.objects.create(individual=jsmith,
+                                               group=org,
+                                               start=datetime.datetime(1999, 1, 1, tzinfo=UTC),
+                                               end=datetime.datetime(2000, 1, 1, tzinfo=UTC))
+
+        msg = INDIVIDUAL_LOCKED_ERROR.format(mk='AAAA')
+        with self.assertRaisesRegex(LockedIdentityError, msg):
+            db.delete_enrollments(self.trxl, jsmith, org,
+                                  [(enrollment.pk, enrollment.start, enrollment.end)])
+
+        enrollments = Enrollment.objects.all()
+        self.assertEqual(len(enrollments), 1)
+
+    def test_operations(self):
+        """Check if the right operations are created when deleting enrollments"""
+
+        timestamp = datetime_utcnow()
+
+        from_date = datetime.datetime(1999, 1, 1, tzinfo=UTC)
+        first_period = datetime.datetime(2000, 1, 1, tzinfo=UTC)
+        second_period = datetime.datetime(2010, 1, 1, tzinfo=UTC)
+        to_date = datetime.datetime(2010, 1, 1, tzinfo=UTC)
+
+        jsmith = Individual.objects.create(mk='AAAA')
+
+        example_org = Organization.add_root(name='Example')
+        enrollment1 = Enrollment.objects.create(individual=jsmith, group=example_org,
+                                                start=from_date, end=first_period)
+        enrollment2 = Enrollment.objects.create(individual=jsmith, group=example_org,
+                                                start=second_period, end=to_date)
+
+        periods = [(enrollment.pk, enrollment.start, enrollment.end)
+                   for enrollment in (enrollment1, enrollment2)]
+        db.delete_enrollments(self.trxl, jsmith, example_org, periods)
+
+        transactions = Transaction.objects.filter(name='withdraw')
+        trx = transactions[0]
+
+        operations = Operation.objects.filter(trx=trx)
+        self.assertEqual(len(operations), 2)
+
+        operations = sorted(operations, key=lambda op: json.loads(op.args)['start'])
+
+        op1 = operations[0]
+        self.assertEqual(op1.op_type, Operation.OpType.DELETE.value)
+        self.assertEqual(op1.entity_type, 'enrollment')
+        self.assertEqual(op1.target, 'AAAA')
+        self.assertGreater(op1.timestamp, timestamp)
+
+        op1_args = json.loads(op1.args)
+        self.assertEqual(len(op1_args), 4)
+        self.assertEqual(op1_args['mk'], 'AAAA')
+        self.assertEqual(op1_args['group'], 'Example')
+        self.assertEqual(op1_args['start'], str(from_date))
+        self.assertEqual(op1_args['end'], str(first_period))
+
+        op2 = operations[1]
+        self.assertEqual(op2.op_type, Operation.OpType.DELETE.value)
+        self.assertEqual(op2.entity_type, 'enrollment')
+        self.assertEqual(op2.target, 'AAAA')
+
+        op2_args = json.loads(op2.args)
+        self.assertEqual(op2_args['start'], str(second_period))
+        self.assertEqual(op2_args['end'], str(to_date))
+
+
 class TestMoveIdentity(TestCase):
     """Unit tests for move_identity"""
 
@@ -522,7 +522,7 @@ class TestAffiliateIndividuals(TestCase):
 
         self.assertDictEqual(result, expected)
 
-    @unittest.mock.patch('sortinghat.core.api.add_enrollment')
+    @unittest.mock.patch('sortinghat.core.api.add_enrollments')
     def test_enrollment_errors(self, mock_enroll):
         """Check if the affiliation process logs the errors there are errors
         adding enrollments"""
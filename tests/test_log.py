@@ -245,6 +245,74 @@ class TestLogTransaction(TestCase):
         self.assertEqual(operation_db.args, json.dumps(input_args2))
         self.assertEqual(input_args2, json.loads(operation_db.args))
 
+    def test_log_operations(self):
+        """Check if a set of operations is logged in bulk"""
+
+        trxl = TransactionsLog.open('test', self.ctx)
+        timestamp1 = datetime_utcnow()
+        timestamp2 = datetime_utcnow()
+        input_args1 = {'mk': '12345abcd'}
+        input_args2 = {'mk': '67890efgh'}
+
+        ops = trxl.log_operations([
+            {
+                'op_type': Operation.OpType.ADD,
+                'entity_type': 'test_entity',
+                'timestamp': timestamp1,
+                'args': input_args1,
+                'target': 'test1'
+            },
+            {
+                'op_type': Operation.OpType.UPDATE,
+                'entity_type': 'test_entity',
+                'timestamp': timestamp2,
+                'args': input_args2,
+                'target': 'test2'
+            }
+        ])
+        self.assertEqual(len(ops), 2)
+
+        operations = Operation.objects.filter(trx=trxl.trx)
+        self.assertEqual(len(operations), 2)
+
+        operation_db = Operation.objects.get(ouid=ops[0].ouid)
+        self.assertEqual(operation_db.op_type, Operation.OpType.ADD.value)
+        self.assertEqual(operation_db.entity_type, 'test_entity')
+        self.assertEqual(operation_db.timestamp, timestamp1)
+        self.assertEqual(operation_db.trx, trxl.trx)
+        self.assertEqual(operation_db.target, 'test1')
+        self.assertEqual(input_args1, json.loads(operation_db.args))
+
+        operation_db = Operation.objects.get(ouid=ops[1].ouid)
+        self.assertEqual(operation_db.op_type, Operation.OpType.UPDATE.value)
+        self.assertEqual(operation_db.entity_type, 'test_entity')
+        self.assertEqual(operation_db.timestamp, timestamp2)
+        self.assertEqual(operation_db.trx, trxl.trx)
+        self.assertEqual(operation_db.target, 'test2')
+        self.assertEqual(input_args2, json.loads(operation_db.args))
+
+    def test_log_operations_closed_transaction(self):
+        """Check if it fails when logging operations on a closed transaction"""
+
+        trxl = TransactionsLog.open('test', self.ctx)
+        tuid = trxl.trx.tuid
+        trxl.close()
+
+        error_msg = OPERATION_TRANSACTION_CLOSED_ERROR.format(tuid=tuid)
+        with self.assertRaisesRegex(ClosedTransactionError, error_msg):
+            trxl.log_operations([
+                {
+                    'op_type': Operation.OpType.ADD,
+                    'entity_type': 'test_entity',
+                    'timestamp': datetime_utcnow(),
+                    'args': {'mk': '12345abcd'},
+                    'target': 'test'
+                }
+            ])
+
+        operations = Operation.objects.filter(trx=trxl.trx)
+        self.assertEqual(len(operations), 0)
+
     def test_log_operation_closed_transaction(self):
         """Check if it fails when logging an operation on a closed transaction"""
 
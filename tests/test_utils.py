@@ -50,6 +50,21 @@ class TestUnnacentString(TestCase):
         with self.assertRaisesRegex(TypeError, UNACCENT_TYPE_ERROR):
             unaccent_string(1234)
 
+    def test_cached(self):
+        """Check whether the results are cached"""
+
+        unaccent_string.cache_clear()
+
+        result = unaccent_string('Santiago Dueñas')
+        self.assertEqual(result, 'Santiago Duenas')
+
+        result = unaccent_string('Santiago Dueñas')
+        self.assertEqual(result, 'Santiago Duenas')
+
+        cache_info = unaccent_string.cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
 
 class TestUUID(TestCase):
     """Unit tests for generate_uuid function"""
@@ -79,6 +94,13 @@ class TestUUID(TestCase):
         result = generate_uuid('scm', email='', name="Max Müster", username='mmuester')
         self.assertEqual(result, '9a0498297d9f0b7e4baf3e6b3740d22d2257367c')
 
+        # Final sigma is lowered taking into account the whole string
+        result = generate_uuid('scm', email='nikos@example.com', name='ΝΙΚΟΣ', username='nikos')
+        self.assertEqual(result, 'd3845095e70a6390f1b6ee7dea33179b063d4f99')
+
+        result = generate_uuid('scm', email='nikos@example.com', name='νικος', username='nikos')
+        self.assertEqual(result, '4f15653eaef469d8f48cbd1e38341c6afe531897')
+
     def test_case_insensitive(self):
         """Check if same values in lower or upper case produce the same UUID"""
 
@@ -125,6 +147,43 @@ class TestUUID(TestCase):
         result = generate_uuid('scm', name="Mishal\udcc5 Pytasz")
         self.assertEqual(result, '625166bdc2c4f1a207d39eb8d25315010babd73b')
 
+    def test_invalid_type(self):
+        """Check if an error is raised when any of the values is not a string"""
+
+        with self.assertRaisesRegex(TypeError, "identity data must be strings or None"):
+            generate_uuid('scm', email='jsmith@example.com', username=1234)
+
+        with self.assertRaises(TypeError):
+            generate_uuid('scm', email='jsmith@example.com', name=1234)
+
+    def test_invalid_surrogate(self):
+        """Check if an error is raised for surrogates that are not escaped bytes"""
+
+        with self.assertRaises(UnicodeEncodeError):
+            generate_uuid('scm', name="Mishal\ud800 Pytasz")
+
+    def test_cached(self):
+        """Check whether the UUIDs are cached"""
+
+        generate_uuid.cache_clear()
+
+        result = generate_uuid('scm', email='jsmith@example.com',
+                               name='John Smith', username='jsmith')
+        self.assertEqual(result, 'a9b403e150dd4af8953a52a4bb841051e4b705d9')
+
+        result = generate_uuid('scm', email='jsmith@example.com',
+                               name='John Smith', username='jsmith')
+        self.assertEqual(result, 'a9b403e150dd4af8953a52a4bb841051e4b705d9')
+
+        cache_info = generate_uuid.cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
+        generate_uuid.cache_clear()
+
+        cache_info = generate_uuid.cache_info()
+        self.assertEqual(cache_info.currsize, 0)
+
     def test_none_source(self):
         """Check whether UUID cannot be obtained giving a None source"""
 